@@ -0,0 +1,37 @@
+"""
+Shared helpers for the EdgeX Python SDK test runners.
+"""
+
+import logging
+import runpy
+
+
+def configure_logging(name: str) -> logging.Logger:
+    """
+    Configure logging for a test runner.
+    
+    Args:
+        name: The name of the runner's logger
+        
+    Returns:
+        logging.Logger: The runner's logger
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    return logging.getLogger(name)
+
+
+def run_integration_tests() -> int:
+    """
+    Run the integration tests as a module in this interpreter.
+    
+    Returns:
+        int: The exit code of the test run
+    """
+    try:
+        runpy.run_module("tests.integration", run_name="__main__", alter_sys=True)
+        return 0
+    except SystemExit as e:
+        return e.code or 0
@@ -9,14 +9,23 @@ This example demonstrates more advanced features of the SDK, including:
 """
 
 import asyncio
+import contextlib
+import functools
 import os
+import signal
+import sys
 import logging
-from decimal import Decimal
-from typing import Dict, Any, List
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR
+from typing import Dict, Any, Optional, Tuple, TypedDict
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 from edgex_sdk import (
     Client,
-    OrderSide,
+    OrderSide,  # Used by the commented-out order example in main()
     OrderType,
     TimeInForce,
     CreateOrderParams,
@@ -36,10 +45,105 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Order statuses after which an order is no longer active. CANCELING orders
+# can no longer fill and are already dropped by cancel_order(), so they are
+# treated as gone; PENDING, OPEN and UNTRIGGERED orders stay active
+TERMINAL_ORDER_STATUSES = {"FILLED", "CANCELING", "CANCELED"}
+
+# Window (seconds) over which active order resync requests are coalesced
+RESYNC_DELAY = 0.5
+
+# Number of buffered WebSocket messages above which market data updates are
+# dropped; account, order and position updates are always buffered
+MESSAGE_QUEUE_SIZE = 10_000
+
+# Subscription kinds whose updates may be dropped under backpressure
+MARKET_DATA_KINDS = {"ticker", "kline", "depth"}
+
+# Maximum number of queued messages dispatched per event loop wakeup
+MESSAGE_BATCH_SIZE = 100
+
+
+def _content_data(message: Dict[str, Any]) -> Any:
+    """
+    Extract the content.data payload from a parsed WebSocket message.
+    
+    Args:
+        message: The parsed WebSocket message
+        
+    Returns:
+        Any: The payload, or None if the message has none
+    """
+    content = message.get("content")
+    return content.get("data") if content else None
+
+
+def _check_result(result: Dict[str, Any], action: str):
+    """
+    Check that an API response reports success.
+    
+    Args:
+        result: The API response
+        action: Description of the request, used in the error message
+        
+    Raises:
+        ValueError: If the response code is not SUCCESS
+    """
+    if result.get("code") != "SUCCESS":
+        raise ValueError(f"Failed to {action}: {result.get('errorParam') or result.get('code')}")
+
+
+class Ticker(TypedDict, total=False):
+    """Ticker data received from the ticker WebSocket channel."""
+    
+    contractId: str
+    priceChange: str
+    priceChangePercent: str
+    trades: str
+    size: str
+    value: str
+    high: str
+    low: str
+    open: str
+    close: str
+    highTime: str
+    lowTime: str
+    startTime: str
+    endTime: str
+    lastPrice: str
+
+
+class MarketData(TypedDict):
+    """Latest market data, keyed by contract ID."""
+    
+    ticker: Dict[str, Ticker]
+    kline: Dict[str, Dict[str, Dict[str, Any]]]  # contract ID -> klineType -> K-line
+    depth: Dict[str, Dict[str, Any]]
+
 
 class EdgeXTrader:
     """Example trader using the EdgeX Python SDK."""
     
+    __slots__ = (
+        "client",
+        "ws_manager",
+        "metadata",
+        "contracts",
+        "market_data",
+        "active_orders",
+        "positions",
+        "assets",
+        "_loop",
+        "_resync_pending",
+        "_messages",
+        "_consumer_task",
+        "_tick_lot",
+        "_dispatch",
+    )
+    
+    # Default active order query, shared read-only by every update
+    _EMPTY_ACTIVE_PARAMS = GetActiveOrderParams()
+    
     def __init__(self, base_url: str, ws_url: str, account_id: int, stark_private_key: str):
         """
         Initialize the trader.
@@ -62,20 +166,57 @@ class EdgeXTrader:
             stark_pri_key=stark_private_key
         )
         
-        self.metadata = None
-        self.contracts = {}
-        self.market_data = {}
-        self.active_orders = {}
-        self.positions = {}
-        self.assets = {}
+        self.metadata: Optional[Dict[str, Any]] = None
+        self.contracts: Dict[str, Dict[str, Any]] = {}
+        self.market_data: MarketData = {"ticker": {}, "kline": {}, "depth": {}}
+        self.active_orders: Dict[str, Dict[str, Any]] = {}
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.assets: Dict[str, Any] = {}
+        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._resync_pending = False
+        self._messages: asyncio.Queue = asyncio.Queue()
+        self._consumer_task: Optional[asyncio.Task] = None
+        
+        # Contract metadata is fixed for the session, so cache tick/lot sizes
+        self._tick_lot = functools.lru_cache(maxsize=256)(self._load_tick_lot)
+        
+        # WebSocket message handlers keyed by subscription kind
+        self._dispatch = {
+            "account": self._on_account,
+            "order": self._on_order,
+            "position": self._on_position,
+            "ticker": self._on_ticker,
+            "kline": self._on_kline,
+            "depth": self._on_depth,
+        }
     
     async def initialize(self):
         """Initialize the trader by fetching metadata and account information."""
         logger.info("Initializing trader...")
         
         try:
-            # Get metadata
-            self.metadata = await self.client.get_metadata()
+            self._loop = asyncio.get_running_loop()
+            
+            # Fetch metadata, account assets, positions and active orders
+            # concurrently while the WebSocket connections are set up
+            results = await asyncio.gather(
+                self.client.get_metadata(),
+                self.client.get_account_asset(),
+                self.client.get_account_positions(),
+                self.update_active_orders(),
+                self.initialize_websocket(),
+                return_exceptions=True
+            )
+            metadata, assets_response, positions_response, _, websocket_ready = results
+            
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            if not websocket_ready:
+                raise ValueError("Failed to initialize WebSocket")
+            
+            self.metadata = metadata
             logger.info("Metadata retrieved")
             
             # Extract contracts
@@ -83,17 +224,15 @@ class EdgeXTrader:
             for contract in contract_list:
                 contract_id = contract.get("contractId")
                 if contract_id:
-                    self.contracts[contract_id] = contract
+                    self.contracts[sys.intern(contract_id)] = contract
             
             logger.info(f"Found {len(self.contracts)} contracts")
             
-            # Get account assets
-            assets_response = await self.client.get_account_asset()
+            # Store account assets
             self.assets = assets_response.get("data", {})
             logger.info("Account assets retrieved")
             
-            # Get account positions
-            positions_response = await self.client.get_account_positions()
+            # Store account positions
             positions_data = positions_response.get("data", {})
             position_list = positions_data.get("positionList", [])
             for position in position_list:
@@ -103,30 +242,25 @@ class EdgeXTrader:
             
             logger.info(f"Found {len(self.positions)} positions")
             
-            # Get active orders
-            await self.update_active_orders()
-            
-            # Initialize WebSocket
-            await self.initialize_websocket()
-            
             logger.info("Trader initialized successfully")
             return True
         
         except Exception as e:
             logger.error(f"Failed to initialize trader: {str(e)}")
+            # Don't leave the WebSockets open after a failed initialization
+            await self.close()
             return False
     
     async def update_active_orders(self):
         """Update the list of active orders."""
         try:
-            params = GetActiveOrderParams()
-            active_orders_response = await self.client.get_active_orders(params)
+            active_orders_response = await self.client.get_active_orders(self._EMPTY_ACTIVE_PARAMS)
             
             order_list = active_orders_response.get("data", {}).get("list", [])
             self.active_orders = {}
             
             for order in order_list:
-                order_id = order.get("orderId")
+                order_id = order.get("id")
                 if order_id:
                     self.active_orders[order_id] = order
             
@@ -137,34 +271,54 @@ class EdgeXTrader:
             logger.error(f"Failed to update active orders: {str(e)}")
             return False
     
+    def _schedule_resync(self):
+        """
+        Schedule a resync of active orders from the REST API.
+        
+        Requests made within RESYNC_DELAY seconds of each other are coalesced
+        into a single update_active_orders() call. Must be called on the event
+        loop.
+        """
+        if self._resync_pending:
+            return
+        self._resync_pending = True
+        self._loop.call_later(RESYNC_DELAY, self._start_resync)
+    
+    def _start_resync(self):
+        """Run the pending resync."""
+        self._resync_pending = False
+        self._loop.create_task(self.update_active_orders())
+    
     async def initialize_websocket(self):
         """Initialize WebSocket connections and subscriptions."""
         try:
-            # Connect to public WebSocket
-            self.ws_manager.connect_public()
-            logger.info("Connected to public WebSocket")
-            
-            # Connect to private WebSocket
-            self.ws_manager.connect_private()
-            logger.info("Connected to private WebSocket")
-            
-            # Subscribe to account updates
-            self.ws_manager.subscribe_account_update(self.handle_account_update)
-            logger.info("Subscribed to account updates")
-            
-            # Subscribe to order updates
-            self.ws_manager.subscribe_order_update(self.handle_order_update)
-            logger.info("Subscribed to order updates")
+            # Message callbacks hand messages to this loop
+            self._loop = asyncio.get_running_loop()
             
-            # Subscribe to position updates
-            self.ws_manager.subscribe_position_update(self.handle_position_update)
-            logger.info("Subscribed to position updates")
-
-            # Subscribe to market data for BTCUSDT (contract ID: 10000001)
-            self.ws_manager.subscribe_ticker("10000001", self.handle_ticker_update)
-            self.ws_manager.subscribe_kline("10000001", "1m", self.handle_kline_update)
-            self.ws_manager.subscribe_depth("10000001", self.handle_depth_update)
-            logger.info("Subscribed to market data for BTCUSDT (10000001)")
+            # Connect to public and private WebSockets concurrently
+            await asyncio.gather(
+                asyncio.to_thread(self.ws_manager.connect_public),
+                asyncio.to_thread(self.ws_manager.connect_private),
+            )
+            logger.info("Connected to public and private WebSockets")
+            
+            # Subscribe to account, order and position updates, and to
+            # market data for BTCUSDT (contract ID: 10000001)
+            subscriptions = [
+                (self.ws_manager.subscribe_account_update, (), "account"),
+                (self.ws_manager.subscribe_order_update, (), "order"),
+                (self.ws_manager.subscribe_position_update, (), "position"),
+                (self.ws_manager.subscribe_ticker, ("10000001",), "ticker"),
+                (self.ws_manager.subscribe_kline, ("10000001", "1m"), "kline"),
+                (self.ws_manager.subscribe_depth, ("10000001",), "depth"),
+            ]
+            # Dispatch received messages from a single consumer task
+            if self._consumer_task is None:
+                self._consumer_task = asyncio.create_task(self._consume_messages())
+            
+            for subscribe, args, kind in subscriptions:
+                subscribe(*args, functools.partial(self._on_message, kind))
+            logger.info(f"Subscribed to {len(subscriptions)} channels")
             
             return True
         
@@ -172,152 +326,193 @@ class EdgeXTrader:
             logger.error(f"Failed to initialize WebSocket: {str(e)}")
             return False
     
-    def handle_account_update(self, message: str):
+    def _on_message(self, kind: str, message: str):
         """
-        Handle account update messages from WebSocket.
+        Queue a WebSocket message for dispatch.
+        
+        Safe to call from the WebSocket thread; the message is handed to the
+        event loop without being parsed.
         
         Args:
+            kind: The subscription kind the message was received on
             message: The WebSocket message
         """
-        try:
-            import json
-            data = json.loads(message)
-            logger.info(f"Account update: {data}")
-            
-            # Update assets
-            account_data = data.get("content", {}).get("data", {})
-            if account_data:
-                self.assets = account_data
-        
-        except Exception as e:
-            logger.error(f"Failed to handle account update: {str(e)}")
+        self._loop.call_soon_threadsafe(self._enqueue_message, kind, message)
+    
+    def _enqueue_message(self, kind: str, message: str):
+        """Put a WebSocket message on the dispatch queue, dropping market data if it is full."""
+        # The queue is unbounded so private updates are never lost or reordered;
+        # only market data, which the next update supersedes, is shed
+        if kind in MARKET_DATA_KINDS and self._messages.qsize() >= MESSAGE_QUEUE_SIZE:
+            logger.warning("Dropped %s update: message queue is full", kind)
+            return
+        self._messages.put_nowait((kind, message))
     
-    def handle_order_update(self, message: str):
+    async def _consume_messages(self):
+        """Dispatch queued WebSocket messages to their handlers."""
+        queue = self._messages
+        while True:
+            kind, message = await queue.get()
+            self._handle_message(kind, message)
+            
+            # Drain messages that are already queued before waiting again
+            for _ in range(min(queue.qsize(), MESSAGE_BATCH_SIZE)):
+                kind, message = queue.get_nowait()
+                self._handle_message(kind, message)
+    
+    def _handle_message(self, kind: str, message: str):
         """
-        Handle order update messages from WebSocket.
+        Parse a WebSocket message once and route it to its handler.
         
         Args:
+            kind: The subscription kind the message was received on
             message: The WebSocket message
         """
         try:
-            import json
-            data = json.loads(message)
-            logger.info(f"Order update: {data}")
-            
-            # Update active orders
-            asyncio.create_task(self.update_active_orders())
+            data = _json.loads(message)
+            self._dispatch[kind](data)
         
         except Exception as e:
-            logger.error(f"Failed to handle order update: {str(e)}")
+            logger.error(f"Failed to handle {kind} update: {str(e)}")
+    
+    def _on_account(self, data: Dict[str, Any]):
+        """
+        Handle account update messages from WebSocket.
+        
+        Args:
+            data: The parsed WebSocket message
+        """
+        logger.info("Account update: %s", data)
+        
+        # Update assets
+        account_data = _content_data(data)
+        if account_data:
+            self.assets = account_data
+    
+    def _on_order(self, data: Dict[str, Any]):
+        """
+        Handle order update messages from WebSocket.
+        
+        Args:
+            data: The parsed WebSocket message
+        """
+        logger.info("Order update: %s", data)
+        
+        # Trade events carry a list of changed orders in content.data.order;
+        # resync over REST (already on the event loop via the message consumer)
+        # if the payload doesn't have that shape
+        payload = _content_data(data)
+        orders = payload.get("order", []) if isinstance(payload, dict) else None
+        if not isinstance(orders, list):
+            self._schedule_resync()
+            return
+        
+        # Apply the order deltas to active orders
+        for order in orders:
+            order_id = order.get("id") if isinstance(order, dict) else None
+            if not order_id:
+                self._schedule_resync()
+                continue
+            
+            if order.get("status") in TERMINAL_ORDER_STATUSES:
+                self.active_orders.pop(order_id, None)
+            else:
+                self.active_orders[order_id] = order
     
-    def handle_position_update(self, message: str):
+    def _on_position(self, data: Dict[str, Any]):
         """
         Handle position update messages from WebSocket.
         
         Args:
-            message: The WebSocket message
+            data: The parsed WebSocket message
         """
-        try:
-            import json
-            data = json.loads(message)
-            logger.info(f"Position update: {data}")
-            
-            # Update positions
-            position_data = data.get("content", {}).get("data", {})
-            contract_id = position_data.get("contractId")
-            
-            if contract_id:
-                self.positions[contract_id] = position_data
+        logger.info("Position update: %s", data)
         
-        except Exception as e:
-            logger.error(f"Failed to handle position update: {str(e)}")
+        # Update positions
+        position_data = _content_data(data)
+        contract_id = position_data.get("contractId") if position_data else None
+        
+        if contract_id:
+            self.positions[contract_id] = position_data
     
-    def handle_ticker_update(self, message: str):
+    def _on_ticker(self, data: Dict[str, Any]):
         """
         Handle ticker update messages from WebSocket.
         
         Args:
-            message: The WebSocket message
+            data: The parsed WebSocket message
         """
-        try:
-            import json
-            data = json.loads(message)
-            
-            # Extract ticker data
-            content = data.get("content", {})
-            ticker_data_list = content.get("data", [])
-
-            # Handle both single ticker and list of tickers
-            if isinstance(ticker_data_list, list) and ticker_data_list:
-                ticker_data = ticker_data_list[0]  # Take the first ticker
-            else:
-                ticker_data = ticker_data_list
-
-            contract_id = ticker_data.get("contractId") if isinstance(ticker_data, dict) else None
-            
+        # Extract ticker data, which may be a single ticker or a list of tickers
+        ticker_data = _content_data(data)
+        if not ticker_data:
+            return
+        items = ticker_data if type(ticker_data) is list else (ticker_data,)
+        
+        tickers = self.market_data["ticker"]
+        for ticker in items:
+            contract_id = ticker.get("contractId")
             if contract_id:
-                if "ticker" not in self.market_data:
-                    self.market_data["ticker"] = {}
-                
-                self.market_data["ticker"][contract_id] = ticker_data
-                logger.info(f"Ticker update for {contract_id}: {ticker_data.get('lastPrice')}")
-        
-        except Exception as e:
-            logger.error(f"Failed to handle ticker update: {str(e)}")
+                tickers[contract_id] = ticker
+                logger.info("Ticker update for %s: %s", contract_id, ticker.get("lastPrice"))
     
-    def handle_kline_update(self, message: str):
+    def _on_kline(self, data: Dict[str, Any]):
         """
         Handle K-line update messages from WebSocket.
         
         Args:
-            message: The WebSocket message
+            data: The parsed WebSocket message
         """
-        try:
-            import json
-            data = json.loads(message)
-            
-            # Extract K-line data
-            kline_data = data.get("content", {}).get("data", {})
-            contract_id = kline_data.get("contractId")
-            interval = kline_data.get("interval")
-            
-            if contract_id and interval:
-                if "kline" not in self.market_data:
-                    self.market_data["kline"] = {}
-                
-                if contract_id not in self.market_data["kline"]:
-                    self.market_data["kline"][contract_id] = {}
-                
-                self.market_data["kline"][contract_id][interval] = kline_data
-                logger.info(f"K-line update for {contract_id} {interval}: {kline_data.get('close')}")
-        
-        except Exception as e:
-            logger.error(f"Failed to handle K-line update: {str(e)}")
+        # Extract K-line data, a list of K-lines keyed by contract and K-line type
+        kline_data = _content_data(data)
+        if not kline_data:
+            return
+        items = kline_data if type(kline_data) is list else (kline_data,)
+        
+        klines = self.market_data["kline"]
+        for kline in items:
+            contract_id = kline.get("contractId")
+            kline_type = kline.get("klineType")
+            if contract_id and kline_type:
+                klines.setdefault(contract_id, {})[kline_type] = kline
+                logger.info("K-line update for %s %s: %s", contract_id, kline_type, kline.get("close"))
     
-    def handle_depth_update(self, message: str):
+    def _on_depth(self, data: Dict[str, Any]):
         """
         Handle depth update messages from WebSocket.
         
         Args:
-            message: The WebSocket message
+            data: The parsed WebSocket message
         """
-        try:
-            import json
-            data = json.loads(message)
-            
-            # Extract depth data
-            depth_data = data.get("content", {}).get("data", {})
-            contract_id = depth_data.get("contractId")
-            
+        # Extract depth data, a list of order book updates
+        depth_data = _content_data(data)
+        if not depth_data:
+            return
+        items = depth_data if type(depth_data) is list else (depth_data,)
+        
+        depths = self.market_data["depth"]
+        for depth in items:
+            contract_id = depth.get("contractId")
             if contract_id:
-                if "depth" not in self.market_data:
-                    self.market_data["depth"] = {}
-                
-                self.market_data["depth"][contract_id] = depth_data
-                logger.info(f"Depth update for {contract_id}")
+                depths[contract_id] = depth
+                logger.debug("Depth update for %s", contract_id)
+    
+    def _load_tick_lot(self, contract_id: str) -> Tuple[Decimal, Decimal, Decimal]:
+        """
+        Get the price tick size, size step and minimum order size for a contract.
         
-        except Exception as e:
-            logger.error(f"Failed to handle depth update: {str(e)}")
+        Args:
+            contract_id: The contract ID
+            
+        Returns:
+            Tuple[Decimal, Decimal, Decimal]: The tick size, step size and
+                minimum order size
+        """
+        contract = self.contracts[contract_id]
+        return (
+            Decimal(contract["tickSize"]),
+            Decimal(contract["stepSize"]),
+            Decimal(contract.get("minOrderSize") or "0"),
+        )
     
     async def create_limit_order(
         self,
@@ -343,39 +538,64 @@ class EdgeXTrader:
             Dict[str, Any]: The created order
             
         Raises:
-            ValueError: If the order creation fails
+            ValueError: If the order price rounds to zero, the order size is
+                below the contract's minimum, or the order creation fails
         """
-        try:
-            # Create order parameters
-            params = CreateOrderParams(
-                contract_id=contract_id,
-                size=size,
-                price=price,
-                type=OrderType.LIMIT,
-                side=side,
-                time_in_force=time_in_force,
-                reduce_only=reduce_only
-            )
-            
-            # Create the order
-            result = await self.client.create_order(params)
-            
-            # Check for success
-            if result.get("code") != "SUCCESS":
-                error_param = result.get("errorParam")
-                if error_param:
-                    raise ValueError(f"Failed to create order: {error_param}")
-                raise ValueError(f"Failed to create order: {result.get('code')}")
-            
-            # Update active orders
-            await self.update_active_orders()
-            
-            logger.info(f"Created limit order: {result.get('data', {}).get('orderId')}")
-            return result
+        # Round the price to the contract's tick size, never past the caller's
+        # limit (down for buys, up for sells), and the size down to its step size
+        if contract_id in self.contracts:
+            tick_size, step_size, min_order_size = self._tick_lot(contract_id)
+            rounding = ROUND_CEILING if getattr(side, "value", side) == "SELL" else ROUND_FLOOR
+            quantized_price = (Decimal(price) / tick_size).to_integral_value(rounding) * tick_size
+            if quantized_price <= 0:
+                raise ValueError(
+                    f"Order price {price} is not positive for contract {contract_id} "
+                    f"after rounding to tick size {tick_size}"
+                )
+            price = format(quantized_price, "f")
+            quantized_size = (Decimal(size) / step_size).to_integral_value(ROUND_DOWN) * step_size
+            if quantized_size <= 0 or quantized_size < min_order_size:
+                raise ValueError(
+                    f"Order size {size} is below the minimum order size for contract "
+                    f"{contract_id} after rounding to step size {step_size}"
+                )
+            size = format(quantized_size, "f")
+        
+        # Create order parameters
+        params = CreateOrderParams(
+            contract_id=contract_id,
+            size=size,
+            price=price,
+            type=OrderType.LIMIT,
+            side=side,
+            time_in_force=time_in_force,
+            reduce_only=reduce_only
+        )
         
-        except Exception as e:
-            logger.error(f"Failed to create limit order: {str(e)}")
-            raise
+        # Create the order
+        result = await self.client.create_order(params)
+        
+        # Check for success
+        _check_result(result, "create order")
+        
+        # Track the order locally in the shape of the order WebSocket channel,
+        # which reconciles it; the response itself only carries the order ID
+        order_id = result.get("data", {}).get("orderId")
+        if order_id:
+            self.active_orders[order_id] = {
+                "id": order_id,
+                "contractId": contract_id,
+                "side": getattr(side, "value", side),
+                "price": price,
+                "size": size,
+                "type": "LIMIT",
+                "timeInForce": getattr(time_in_force, "value", time_in_force),
+                "reduceOnly": reduce_only,
+                "status": "OPEN",
+            }
+        
+        logger.info(f"Created limit order: {order_id}")
+        return result
     
     async def cancel_order(self, order_id: str) -> Dict[str, Any]:
         """
@@ -390,29 +610,20 @@ class EdgeXTrader:
         Raises:
             ValueError: If the order cancellation fails
         """
-        try:
-            # Create cancel order parameters
-            params = CancelOrderParams(order_id=order_id)
-            
-            # Cancel the order
-            result = await self.client.cancel_order(params)
-            
-            # Check for success
-            if result.get("code") != "SUCCESS":
-                error_param = result.get("errorParam")
-                if error_param:
-                    raise ValueError(f"Failed to cancel order: {error_param}")
-                raise ValueError(f"Failed to cancel order: {result.get('code')}")
-            
-            # Update active orders
-            await self.update_active_orders()
-            
-            logger.info(f"Cancelled order: {order_id}")
-            return result
+        # Create cancel order parameters
+        params = CancelOrderParams(order_id=order_id)
         
-        except Exception as e:
-            logger.error(f"Failed to cancel order: {str(e)}")
-            raise
+        # Cancel the order
+        result = await self.client.cancel_order(params)
+        
+        # Check for success
+        _check_result(result, "cancel order")
+        
+        # Drop the order locally; the order WebSocket channel reconciles it
+        self.active_orders.pop(order_id, None)
+        
+        logger.info(f"Cancelled order: {order_id}")
+        return result
     
     async def cancel_all_orders(self, contract_id: str = None) -> Dict[str, Any]:
         """
@@ -427,29 +638,27 @@ class EdgeXTrader:
         Raises:
             ValueError: If the order cancellation fails
         """
-        try:
-            # Create cancel order parameters
-            params = CancelOrderParams(contract_id=contract_id or "")
-            
-            # Cancel the orders
-            result = await self.client.cancel_order(params)
-            
-            # Check for success
-            if result.get("code") != "SUCCESS":
-                error_param = result.get("errorParam")
-                if error_param:
-                    raise ValueError(f"Failed to cancel orders: {error_param}")
-                raise ValueError(f"Failed to cancel orders: {result.get('code')}")
-            
-            # Update active orders
-            await self.update_active_orders()
-            
-            logger.info(f"Cancelled all orders for contract: {contract_id or 'all'}")
-            return result
+        # Create cancel order parameters
+        params = CancelOrderParams(contract_id=contract_id or "")
+        
+        # Cancel the orders
+        result = await self.client.cancel_order(params)
+        
+        # Check for success
+        _check_result(result, "cancel orders")
+        
+        # Drop the orders locally; the order WebSocket channel reconciles them
+        if contract_id:
+            self.active_orders = {
+                order_id: order
+                for order_id, order in self.active_orders.items()
+                if order.get("contractId") != contract_id
+            }
+        else:
+            self.active_orders = {}
         
-        except Exception as e:
-            logger.error(f"Failed to cancel all orders: {str(e)}")
-            raise
+        logger.info(f"Cancelled all orders for contract: {contract_id or 'all'}")
+        return result
     
     async def get_order_fill_transactions(
         self,
@@ -471,32 +680,23 @@ class EdgeXTrader:
         Raises:
             ValueError: If the request fails
         """
-        try:
-            # Create parameters
-            params = OrderFillTransactionParams(
-                size=size,
-                offset_data=offset_data
-            )
-            
-            if contract_id:
-                params.filter_contract_id_list = [contract_id]
-            
-            # Get order fill transactions
-            result = await self.client.get_order_fill_transactions(params)
-            
-            # Check for success
-            if result.get("code") != "SUCCESS":
-                error_param = result.get("errorParam")
-                if error_param:
-                    raise ValueError(f"Failed to get order fill transactions: {error_param}")
-                raise ValueError(f"Failed to get order fill transactions: {result.get('code')}")
-            
-            logger.info(f"Got order fill transactions: {len(result.get('data', {}).get('list', []))}")
-            return result
+        # Create parameters
+        params = OrderFillTransactionParams(
+            size=size,
+            offset_data=offset_data
+        )
         
-        except Exception as e:
-            logger.error(f"Failed to get order fill transactions: {str(e)}")
-            raise
+        if contract_id:
+            params.filter_contract_id_list = [contract_id]
+        
+        # Get order fill transactions
+        result = await self.client.get_order_fill_transactions(params)
+        
+        # Check for success
+        _check_result(result, "get order fill transactions")
+        
+        logger.info(f"Got order fill transactions: {len(result.get('data', {}).get('list', []))}")
+        return result
     
     async def get_k_line(
         self,
@@ -520,31 +720,22 @@ class EdgeXTrader:
         Raises:
             ValueError: If the request fails
         """
-        try:
-            # Create parameters
-            params = GetKLineParams(
-                contract_id=contract_id,
-                interval=interval,
-                size=size,
-                offset_data=offset_data
-            )
-            
-            # Get K-line data
-            result = await self.client.quote.get_k_line(params)
-            
-            # Check for success
-            if result.get("code") != "SUCCESS":
-                error_param = result.get("errorParam")
-                if error_param:
-                    raise ValueError(f"Failed to get K-line data: {error_param}")
-                raise ValueError(f"Failed to get K-line data: {result.get('code')}")
-            
-            logger.info(f"Got K-line data: {len(result.get('data', {}).get('list', []))}")
-            return result
+        # Create parameters
+        params = GetKLineParams(
+            contract_id=contract_id,
+            interval=interval,
+            size=size,
+            offset_data=offset_data
+        )
         
-        except Exception as e:
-            logger.error(f"Failed to get K-line data: {str(e)}")
-            raise
+        # Get K-line data
+        result = await self.client.quote.get_k_line(params)
+        
+        # Check for success
+        _check_result(result, "get K-line data")
+        
+        logger.info(f"Got K-line data: {len(result.get('data', {}).get('list', []))}")
+        return result
     
     async def get_order_book_depth(
         self,
@@ -564,29 +755,20 @@ class EdgeXTrader:
         Raises:
             ValueError: If the request fails
         """
-        try:
-            # Create parameters
-            params = GetOrderBookDepthParams(
-                contract_id=contract_id,
-                limit=limit
-            )
-            
-            # Get order book depth
-            result = await self.client.quote.get_order_book_depth(params)
-            
-            # Check for success
-            if result.get("code") != "SUCCESS":
-                error_param = result.get("errorParam")
-                if error_param:
-                    raise ValueError(f"Failed to get order book depth: {error_param}")
-                raise ValueError(f"Failed to get order book depth: {result.get('code')}")
-            
-            logger.info(f"Got order book depth for {contract_id}")
-            return result
+        # Create parameters
+        params = GetOrderBookDepthParams(
+            contract_id=contract_id,
+            limit=limit
+        )
         
-        except Exception as e:
-            logger.error(f"Failed to get order book depth: {str(e)}")
-            raise
+        # Get order book depth
+        result = await self.client.quote.get_order_book_depth(params)
+        
+        # Check for success
+        _check_result(result, "get order book depth")
+        
+        logger.info(f"Got order book depth for {contract_id}")
+        return result
     
     async def close(self):
         """Close all connections."""
@@ -595,6 +777,13 @@ class EdgeXTrader:
             self.ws_manager.disconnect_all()
             logger.info("Disconnected from WebSocket")
             
+            # Stop dispatching WebSocket messages
+            if self._consumer_task is not None:
+                self._consumer_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._consumer_task
+                self._consumer_task = None
+            
             return True
         
         except Exception as e:
@@ -602,6 +791,19 @@ class EdgeXTrader:
             return False
 
 
+async def wait_for_shutdown():
+    """Wait until the process receives SIGINT or SIGTERM."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Signal handlers are not supported by the Windows event loop
+            pass
+    await stop.wait()
+
+
 async def main():
     """Main function."""
     # Load configuration from environment variables
@@ -644,9 +846,9 @@ async def main():
         # if order and order.get("data", {}).get("orderId"):
         #     await trader.cancel_order(order.get("data", {}).get("orderId"))
         
-        # Wait for some WebSocket updates
-        logger.info("Waiting for WebSocket updates...")
-        await asyncio.sleep(60)
+        # Wait for WebSocket updates until interrupted
+        logger.info("Waiting for WebSocket updates (press Ctrl+C to stop)...")
+        await wait_for_shutdown()
     
     finally:
         # Close connections
@@ -654,4 +856,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop for the event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
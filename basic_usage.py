@@ -12,16 +12,30 @@ This example demonstrates the basic functionality of the SDK:
 
 import asyncio
 import os
+import signal
 
 from edgex_sdk import (
     Client,
-    OrderSide,
+    OrderSide,  # Used by the commented-out order example in main()
     GetKLineParams,
     GetOrderBookDepthParams,
     WebSocketManager
 )
 
 
+async def wait_for_shutdown():
+    """Wait until the process receives SIGINT or SIGTERM."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Signal handlers are not supported by the Windows event loop
+            pass
+    await stop.wait()
+
+
 async def main():
     # Load configuration from environment variables
     base_url = os.getenv("EDGEX_BASE_URL", "https://testnet.edgex.exchange")
@@ -103,12 +117,19 @@ async def main():
     ws_manager.subscribe_ticker("10000004", ticker_handler)
     ws_manager.subscribe_kline("10000004", "1m", kline_handler)
 
-    # Wait for updates
-    await asyncio.sleep(30)
+    # Wait for updates until interrupted
+    print("Waiting for updates (press Ctrl+C to stop)...")
+    await wait_for_shutdown()
 
     # Disconnect all connections
     ws_manager.disconnect_all()
 
 
 if __name__ == "__main__":
+    # Use uvloop for the event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -0,0 +1,55 @@
+"""
+Pytest configuration for the EdgeX Python SDK tests.
+"""
+
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Group collected tests into batches for pytest-xdist.
+
+    When EDGEX_TEST_BATCH_SIZE is set (see run_public_tests.py --batch-size),
+    consecutive tests are assigned to xdist groups of that size so that
+    --dist=loadgroup runs each batch on a single worker.
+    """
+    batch_size = int(os.environ.get("EDGEX_TEST_BATCH_SIZE", "0"))
+    if batch_size < 1:
+        return
+
+    # Group by collection order, which is the same on every worker
+    for index, item in enumerate(items):
+        item.add_marker(pytest.mark.xdist_group(name=f"public_batch_{index // batch_size}"))
+
+
+@pytest.fixture(scope="module")
+def edgex_session():
+    """
+    HTTP session with connection pooling, shared by the tests in a module.
+
+    Reusing one session avoids a new TCP and TLS handshake for every test.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=3))
+    yield session
+    session.close()
+
+
+@pytest.fixture(autouse=True)
+def _inject_edgex_session(request):
+    """
+    Expose edgex_session on unittest.TestCase classes that request it.
+
+    Usage:
+        @pytest.mark.usefixtures("edgex_session")
+        class TestQuote(unittest.TestCase):
+            def test_ticker(self):
+                self.edgex_session.get(...)
+    """
+    if request.cls is not None and "edgex_session" in request.fixturenames:
+        request.cls.edgex_session = request.getfixturevalue("edgex_session")
@@ -5,22 +5,22 @@ Integration test runner for the EdgeX Python SDK.
 
 import os
 import sys
-import subprocess
-import logging
 
-from tests.integration.config import check_env_vars
+from _runner import configure_logging, run_integration_tests
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Environment variables required by the integration tests
+REQUIRED_ENV_VARS = (
+    "EDGEX_BASE_URL",
+    "EDGEX_ACCOUNT_ID",
+    "EDGEX_STARK_PRIVATE_KEY",
+    "EDGEX_WS_URL",
 )
-logger = logging.getLogger(__name__)
+
+logger = configure_logging(__name__)
 
 # Check if required environment variables are set
-env_status = check_env_vars()
-if not env_status["all_set"]:
-    missing_vars = env_status["missing_vars"]
+missing_vars = [var for var in REQUIRED_ENV_VARS if not os.environ.get(var)]
+if missing_vars:
     logger.error(f"Cannot run integration tests because the following environment variables are not set: {', '.join(missing_vars)}")
     logger.error("Please set these environment variables and try again.")
     sys.exit(1)
@@ -32,8 +32,5 @@ if not env_status["all_set"]:
 logger.info("Running integration tests with the StarkEx signing adapter.")
 logger.info("This means that cryptographic operations are performed using the actual Stark curve implementation.")
 
-# Run the integration tests as a module
-result = subprocess.run([sys.executable, "-m", "tests.integration"])
-
-# Exit with the same exit code
-sys.exit(result.returncode)
+# Run the integration tests and exit with the same exit code
+sys.exit(run_integration_tests())
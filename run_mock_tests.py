@@ -12,15 +12,10 @@ structure and mock signing adapter.
 
 import os
 import sys
-import subprocess
-import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+from _runner import configure_logging, run_integration_tests
+
+logger = configure_logging(__name__)
 
 # Set dummy environment variables
 os.environ["EDGEX_BASE_URL"] = "https://testnet.edgex.exchange"
@@ -34,8 +29,5 @@ logger.info("Running integration tests with dummy credentials and a mock signing
 logger.info("This means that API calls will fail, but the SDK structure and mock signing adapter can be tested.")
 logger.info("For actual API testing, use the run_integration_tests.py script with valid credentials.")
 
-# Run the integration tests as a module
-result = subprocess.run([sys.executable, "-m", "tests.integration"])
-
-# Exit with the same exit code
-sys.exit(result.returncode)
+# Run the integration tests and exit with the same exit code
+sys.exit(run_integration_tests())
@@ -3,50 +3,447 @@
 Public endpoints test runner for the EdgeX Python SDK.
 
 This script runs tests for public endpoints that don't require authentication.
+Tests run in parallel with pytest-xdist when it is installed, and otherwise in
+unittest shards on a process pool.
+
+Usage:
+    python run_public_tests.py [--batch-size N] [--failfast] [-v]
 """
 
+import argparse
+import glob
+import hashlib
+import importlib.util
+import io
+import itertools
+import json
 import os
 import sys
+import time
 import unittest
-import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from _runner import configure_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+# Directory containing the public endpoint tests
+PUBLIC_TEST_DIR = "tests/integration/public"
 
-# Set dummy values for required environment variables
+# Dummy values for required environment variables
 # These won't be used for authentication but are needed for client initialization
-os.environ["EDGEX_BASE_URL"] = "https://pro.edgex.exchange"
-# Use the correct WebSocket URL
-os.environ["EDGEX_WS_URL"] = "wss://quote.edgex.exchange"
-os.environ["EDGEX_ACCOUNT_ID"] = "0"  # Dummy value
-os.environ["EDGEX_STARK_PRIVATE_KEY"] = "0" * 64  # Dummy value
-os.environ["EDGEX_SIGNING_ADAPTER"] = "mock"  # Use mock adapter
-os.environ["EDGEX_PUBLIC_ONLY"] = "true"  # Flag to indicate public endpoints only
+_PUBLIC_ENV = {
+    "EDGEX_BASE_URL": "https://pro.edgex.exchange",
+    "EDGEX_WS_URL": "wss://quote.edgex.exchange",  # Use the correct WebSocket URL
+    "EDGEX_ACCOUNT_ID": "0",  # Dummy value
+    "EDGEX_STARK_PRIVATE_KEY": "0" * 64,  # Dummy value
+    "EDGEX_SIGNING_ADAPTER": "mock",  # Use mock adapter
+    "EDGEX_PUBLIC_ONLY": "true",  # Flag to indicate public endpoints only
+}
+
+# Cached test IDs from the last discovery of the public tests
+MANIFEST_PATH = os.path.join(PUBLIC_TEST_DIR, ".test_manifest.json")
+
+# Durations of the public tests from previous runs, used to run fast tests first
+TIMES_PATH = os.path.join(PUBLIC_TEST_DIR, ".test_times.json")
+
+logger = configure_logging(__name__)
+
+
+def flatten(suite: unittest.TestSuite) -> Iterator[unittest.TestCase]:
+    """
+    Flatten a test suite into its test cases.
+
+    Args:
+        suite: The test suite
+
+    Returns:
+        Iterator[unittest.TestCase]: The test cases in the suite
+    """
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from flatten(test)
+        else:
+            yield test
+
+
+def _manifest_key() -> str:
+    """
+    Compute a key identifying the current set of public test files.
+
+    Returns:
+        str: A hash of the paths, modification times and sizes of the test files
+    """
+    digest = hashlib.blake2b()
+    for path in sorted(glob.glob(os.path.join(PUBLIC_TEST_DIR, "**", "test_*.py"), recursive=True)):
+        stat = os.stat(path)
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def discover_test_ids() -> Tuple[List[str], List[unittest.TestCase]]:
+    """
+    Discover the public test IDs, reusing the manifest if the test files are unchanged.
+
+    Returns:
+        Tuple[List[str], List[unittest.TestCase]]: The IDs of the public tests,
+            and placeholder tests for modules that failed to load
+    """
+    key = _manifest_key()
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+        if manifest.get("key") == key:
+            return manifest["ids"], []
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+
+    test_ids = []
+    load_failures = []
+    for test in flatten(unittest.TestLoader().discover(PUBLIC_TEST_DIR, pattern='test_*.py')):
+        # unittest reports modules that fail to import as unittest.loader._FailedTest
+        # placeholders, which can't be reloaded by ID and must run here to report the error
+        if test.id().startswith("unittest.loader."):
+            load_failures.append(test)
+        else:
+            test_ids.append(test.id())
+
+    # Don't cache discovery that failed to import a test module
+    if not load_failures:
+        with open(MANIFEST_PATH, "w") as f:
+            json.dump({"key": key, "ids": test_ids}, f)
+
+    return test_ids, load_failures
+
+
+def group_tests(test_ids: Iterable[str], times: Dict[str, float]) -> List[List[List[str]]]:
+    """
+    Group test IDs by module and class, fastest first.
+
+    Modules are ordered by their total duration from previous runs, and the
+    classes within each module likewise, so that each module and class runs
+    contiguously and its setUpModule/setUpClass runs once. Tests without a
+    recorded duration count as slowest.
+
+    Args:
+        test_ids: The test IDs
+        times: Durations of previous runs in seconds, keyed by test ID
+
+    Returns:
+        List[List[List[str]]]: The test IDs of each class, grouped by module
+    """
+    modules: Dict[str, Dict[str, List[str]]] = {}
+    for test_id in test_ids:
+        class_name = test_id.rsplit(".", 1)[0]
+        module_name = class_name.rsplit(".", 1)[0]
+        modules.setdefault(module_name, {}).setdefault(class_name, []).append(test_id)
+
+    def duration(ids: Iterable[str]) -> float:
+        return sum(times.get(test_id, float("inf")) for test_id in ids)
+
+    grouped = []
+    for classes in modules.values():
+        grouped.append(sorted(classes.values(), key=duration))
+    grouped.sort(key=lambda module: duration(itertools.chain.from_iterable(module)))
+    return grouped
+
+
+def batched(classes: Iterable[List[str]], size: int) -> Iterator[List[str]]:
+    """
+    Split test classes into batches of at least the given number of tests.
+
+    Classes are never split, so a batch holds more tests than size when a
+    class does not fit evenly.
+
+    Args:
+        classes: The test IDs of each class
+        size: The number of tests per batch
+
+    Returns:
+        Iterator[List[str]]: The batches of test IDs
+    """
+    batch: List[str] = []
+    for test_ids in classes:
+        batch.extend(test_ids)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _init_worker(env: Dict[str, str]):
+    """
+    Prepare a process pool worker for running tests.
+
+    Args:
+        env: Environment variables to set in the worker
+    """
+    os.environ.update(env)
+    # Discovered test modules are named relative to the test directory
+    sys.path.insert(0, os.path.abspath(PUBLIC_TEST_DIR))
+
+
+class TimedTextTestResult(unittest.TextTestResult):
+    """Test result that records how long each test takes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.times: Dict[str, float] = {}
+        self._started = 0.0
+
+    def startTest(self, test):
+        self._started = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        self.times[test.id()] = time.perf_counter() - self._started
+        super().stopTest(test)
+
+
+def load_test_times() -> Dict[str, float]:
+    """
+    Load test durations recorded by previous runs.
+
+    Returns:
+        Dict[str, float]: Durations in seconds, keyed by test ID
+    """
+    try:
+        with open(TIMES_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _buffered_stderr() -> io.TextIOWrapper:
+    """
+    Open a block-buffered text stream on stderr.
+
+    Returns:
+        io.TextIOWrapper: The stream, which must be closed to flush its output
+    """
+    raw = open(sys.stderr.fileno(), "wb", buffering=1 << 16, closefd=False)
+    return io.TextIOWrapper(raw, encoding="utf-8", write_through=False)
+
+
+def _run_suite(
+    suite: unittest.TestSuite,
+    verbosity: int = 1,
+    failfast: bool = False
+) -> Tuple[int, int, Dict[str, float]]:
+    """
+    Run a test suite with buffered output.
+
+    Args:
+        suite: The test suite
+        verbosity: The unittest output verbosity
+        failfast: Whether to stop on the first failure or error
+
+    Returns:
+        Tuple[int, int, Dict[str, float]]: The number of failures and errors,
+            and the duration of each test that ran
+    """
+    stream = _buffered_stderr()
+    try:
+        runner = unittest.TextTestRunner(
+            stream=stream,
+            verbosity=verbosity,
+            failfast=failfast,
+            buffer=True,
+            resultclass=TimedTextTestResult
+        )
+        result = runner.run(suite)
+    finally:
+        stream.close()
+    return len(result.failures), len(result.errors), result.times
+
+
+def _run_shard(
+    test_ids: List[str],
+    verbosity: int = 1,
+    failfast: bool = False
+) -> Tuple[int, int, Dict[str, float]]:
+    """
+    Run a shard of tests.
+
+    Args:
+        test_ids: The IDs of the tests to run, in order
+        verbosity: The unittest output verbosity
+        failfast: Whether to stop on the first failure or error
+
+    Returns:
+        Tuple[int, int, Dict[str, float]]: The number of failures and errors,
+            and the duration of each test that ran
+    """
+    suite = unittest.TestLoader().loadTestsFromNames(test_ids)
+    return _run_suite(suite, verbosity, failfast)
+
+
+def run_with_pytest(
+    batch_size: Optional[int] = None,
+    verbosity: int = 1,
+    failfast: bool = False
+) -> int:
+    """
+    Run the public endpoint tests with pytest-xdist.
+
+    Args:
+        batch_size: Number of tests to run together on one worker (optional)
+        verbosity: The output verbosity
+        failfast: Whether to stop on the first failure or error
+
+    Returns:
+        int: The pytest exit code, or 0 if no tests were collected
+    """
+    import pytest
+
+    if batch_size:
+        # conftest.py groups the collected tests into batches of this size
+        os.environ["EDGEX_TEST_BATCH_SIZE"] = str(batch_size)
+        dist = "--dist=loadgroup"
+    else:
+        # Keep each test file on one worker so module-level setup is shared
+        # by the tests in that file
+        dist = "--dist=loadfile"
+
+    verbosity_flag = "-q" if verbosity <= 1 else "-" + "v" * (verbosity - 1)
+
+    pytest_args = ["-n", "auto", dist, verbosity_flag, PUBLIC_TEST_DIR]
+    if failfast:
+        pytest_args.insert(0, "-x")
+
+    exit_code = pytest.main(pytest_args)
+
+    # Nothing ran and nothing failed, as with the process pool runner
+    if exit_code == pytest.ExitCode.NO_TESTS_COLLECTED:
+        return 0
+    return exit_code
+
+
+def run_with_process_pool(
+    batch_size: Optional[int] = None,
+    verbosity: int = 1,
+    failfast: bool = False
+) -> int:
+    """
+    Run the public endpoint tests in unittest shards on a process pool.
+
+    Args:
+        batch_size: Number of tests per shard (optional, defaults to one
+            shard per worker)
+        verbosity: The unittest output verbosity
+        failfast: Whether to stop on the first failure or error
+
+    Returns:
+        int: The total number of failures and errors
+    """
+    test_ids, load_failures = discover_test_ids()
+
+    # Report test modules that failed to import with their original error
+    total = 0
+    if load_failures:
+        failures, errors, _ = _run_suite(unittest.TestSuite(load_failures), verbosity, failfast)
+        total += failures + errors
+        if failfast and total:
+            return total
+
+    if not test_ids:
+        if not load_failures:
+            logger.info("No public endpoint tests found")
+        return total
+
+    # Run the modules and classes that were fastest last time first, and new
+    # tests last, without splitting a class across shards
+    times = load_test_times()
+    modules = group_tests(test_ids, times)
+
+    # Leave two cores free for the rest of the system
+    workers = max(1, (os.cpu_count() or 2) - 2)
+    if batch_size:
+        shards = list(batched(itertools.chain.from_iterable(modules), batch_size))
+    else:
+        # Keep each module on one shard so module-level setup runs once
+        shards = [
+            list(itertools.chain.from_iterable(itertools.chain.from_iterable(modules[i::workers])))
+            for i in range(min(workers, len(modules)))
+        ]
+    workers = min(workers, len(shards))
+    logger.info(f"Running {len(test_ids)} tests in {len(shards)} shards on {workers} workers")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(_PUBLIC_ENV,)
+    ) as executor:
+        futures = [executor.submit(_run_shard, shard, verbosity, failfast) for shard in shards]
+        for future in as_completed(futures):
+            failures, errors, shard_times = future.result()
+            total += failures + errors
+            times.update(shard_times)
+            if failfast and total:
+                # Skip the shards that have not started yet
+                for pending in futures:
+                    pending.cancel()
+                break
+
+    with open(TIMES_PATH, "w") as f:
+        json.dump(times, f)
+
+    return total
+
+
+def main() -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Run the EdgeX public endpoint tests.")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="number of tests to run together on one worker"
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=1,
+        help="increase output verbosity (repeat for more)"
+    )
+    parser.add_argument(
+        "--failfast",
+        action="store_true",
+        help="stop on the first failure or error"
+    )
+    args = parser.parse_args()
+    if args.batch_size is not None and args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
 
-# Log information
-logger.info("Running tests for public endpoints only")
-logger.info("These tests don't require authentication credentials")
+    # Set dummy values for required environment variables
+    os.environ.update(_PUBLIC_ENV)
 
-# Create the public test directory if it doesn't exist
-os.makedirs("tests/integration/public", exist_ok=True)
+    # Log information
+    logger.info("Running tests for public endpoints only")
+    logger.info("These tests don't require authentication credentials")
 
-# Create an __init__.py file in the public test directory
-with open("tests/integration/public/__init__.py", "w") as f:
-    f.write("# Public endpoint tests\n")
+    # Create the public test directory and its __init__.py file, writing only
+    # when the file is missing or differs so steady-state runs touch nothing
+    init_path = os.path.join(PUBLIC_TEST_DIR, "__init__.py")
+    init_content = b"# Public endpoint tests\n"
+    try:
+        with open(init_path, "rb") as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = None
+    if current != init_content:
+        os.makedirs(PUBLIC_TEST_DIR, exist_ok=True)
+        with open(init_path, "wb") as f:
+            f.write(init_content)
 
-# Discover and run tests
-test_loader = unittest.TestLoader()
+    if importlib.util.find_spec("xdist") is None:
+        logger.info("pytest-xdist is not installed, running tests on a process pool")
+        return run_with_process_pool(args.batch_size, args.verbose, args.failfast)
 
-# Run the public endpoint tests
-test_suite = test_loader.discover('tests/integration/public', pattern='test_*.py')
+    return run_with_pytest(args.batch_size, args.verbose, args.failfast)
 
-# Run the tests
-test_runner = unittest.TextTestRunner(verbosity=2)
-result = test_runner.run(test_suite)
 
-# Exit with the number of failures and errors
-sys.exit(len(result.failures) + len(result.errors))
+if __name__ == "__main__":
+    # Exit with the pytest exit code, or the number of failures and errors
+    sys.exit(main())